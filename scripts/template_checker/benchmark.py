@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Template Checker Benchmark
+
+Times serial comparison against the process pool used by analyze_all_files, on
+synthetic template/parent pairs, to check where PARALLEL_MIN_FILES should sit.
+
+Usage:
+    python benchmark.py [--pairs N [N ...]] [--lines N] [--repeat N] [--start-method METHOD]
+
+Options:
+    --pairs         Pair counts to time (default: 4 8 16 32 64)
+    --lines         Lines per generated parent file (default: 300)
+    --repeat        Runs per measurement; the fastest is reported (default: 3)
+    --start-method  multiprocessing start method for the pool (default: platform default)
+
+Example:
+    python benchmark.py --pairs 4 16 64 --lines 1000 --start-method spawn
+"""
+
+import os
+import sys
+import time
+import tempfile
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import template_checker  # noqa: E402
+
+
+def write_pairs(base_dir: str, pairs: int, lines: int) -> tuple[list[str], list[str]]:
+    """Write env-style template/parent pairs where the parent has extra and changed lines."""
+    template_files = []
+    parent_files = []
+    for i in range(pairs):
+        template_file = f"service{i}.env.template"
+        parent_file = f"service{i}.env"
+        with open(os.path.join(base_dir, template_file), 'w', encoding='utf-8') as f:
+            for j in range(lines - lines // 10):
+                f.write(f"SERVICE{i}_SETTING_{j}=example\n")
+                if j % 20 == 0:
+                    f.write(f"# Section {j // 20}\n\n")
+        with open(os.path.join(base_dir, parent_file), 'w', encoding='utf-8') as f:
+            for j in range(lines):
+                f.write(f"SERVICE{i}_SETTING_{j}=value-{j}\n")
+                if j % 25 == 0:
+                    f.write(f'  "option_{j}": "{j}"\n')
+        template_files.append(template_file)
+        parent_files.append(parent_file)
+    return template_files, parent_files
+
+
+def best_of(repeat: int, func) -> float:
+    """Return the fastest wall-clock time of repeat calls to func."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serial vs parallel template comparison')
+    parser.add_argument('--pairs', type=int, nargs='+', default=[4, 8, 16, 32, 64],
+                        help='Pair counts to time')
+    parser.add_argument('--lines', type=int, default=300, help='Lines per generated parent file')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement')
+    parser.add_argument('--start-method', help='multiprocessing start method for the pool')
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context(args.start_method)
+    workers = os.cpu_count() or 1
+    print(f"CPUs: {workers}  start method: {context.get_start_method()}  "
+          f"lines per file: {args.lines}")
+    print(f"{'pairs':>6} {'serial (s)':>11} {'pool (s)':>10} {'pool/serial':>12}")
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        for pairs in args.pairs:
+            template_files, parent_files = write_pairs(base_dir, pairs, args.lines)
+            compare = partial(template_checker._compare, base_dir)
+
+            # Clear the normalize memo before every run; forked workers would inherit it warm
+            def serial():
+                template_checker._normalize_bytes.cache_clear()
+                list(map(compare, template_files, parent_files))
+
+            def pool():
+                template_checker._normalize_bytes.cache_clear()
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                    list(executor.map(compare, template_files, parent_files, chunksize=8))
+
+            serial_time = best_of(args.repeat, serial)
+            pool_time = best_of(args.repeat, pool)
+            print(f"{pairs:>6} {serial_time:>11.4f} {pool_time:>10.4f} "
+                  f"{pool_time / serial_time:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()